@@ -6,7 +6,15 @@ Focus on: chartLabels, recommendations, leaderTitle
 """
 
 import asyncio
+import collections
+import heapq
+import logging
+import math
+import queue
+import random
+import sys
 import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from Humanization import Humanization, HumanizationConfig
 
@@ -15,6 +23,7 @@ CONFIG = {
     'url': 'https://app.custom.one/page-result/694ad7fa184497e032fefc1a',
     'session_duration': 60,  # seconds
     'viewport': {'width': 1920, 'height': 1080},
+    'video_size': {'width': 1280, 'height': 720},  # Downscaled on capture, cheaper to encode
 
     # Selectors for focus elements
     'selectors': {
@@ -40,38 +49,81 @@ CONFIG = {
 }
 
 
+# Element type -> priority level, built once at load
+# Listed lowest first so 'high' wins if a type appears in several levels
+PRIORITY_MAP = {
+    element_type: level
+    for level in ('skip', 'medium', 'high')
+    for element_type in CONFIG['priorities'][level]
+}
+
+# Selector strings and the in-page collector, built once at load for find_elements
+ELEMENT_TYPES = list(CONFIG['selectors'])
+SELECTORS = list(CONFIG['selectors'].values())
+COMBINED_SELECTOR = ', '.join(SELECTORS)
+COLLECT_ELEMENTS_JS = """([combined, selectors]) => [...document.querySelectorAll(combined)].map(el => {
+    // No client rects means not rendered - bounding_box() gives null too
+    const rect = el.getClientRects().length ? el.getBoundingClientRect() : null;
+    return {
+        types: selectors.flatMap((selector, idx) => el.matches(selector) ? [idx] : []),
+        box: rect && {x: rect.x, y: rect.y, width: rect.width, height: rect.height}
+    };
+})"""
+
+# Per-element timing ranges and estimates (seconds), used to fit elements into the session
+HOVER_RANGE = (1.8, 2.8)
+IDLE_RANGE = (2.2, 4.2)
+SWIFT_PAUSE_RANGE = (0.4, 0.8)
+SWIFT_MOVE_RANGE = (0.35, 0.6)
+APPROACH_COST = 1.5  # Humanization.move_to in slow mode: ~200 interpolated steps at 2-15ms
+TRACE_COST = 0.8  # Upper bound of the optional outline trace
+MIN_READ_TIME = 1  # Below this, hover + idle get too short to look like reading
+MIN_INTERACTION_COST = APPROACH_COST + TRACE_COST + MIN_READ_TIME
+SWIFT_COST = SWIFT_PAUSE_RANGE[1] + SWIFT_MOVE_RANGE[1]
+
+log = logging.getLogger('recorder')
+
+
+def start_log_listener():
+    """
+    Route recorder logs through a queue drained by a background thread
+    so writing to stdout never blocks the event loop
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    log.addHandler(QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
 class ElementPrioritizer:
     """Track and prioritize element interactions"""
 
+    TOP_N = 5
+
     def __init__(self):
-        self.interactions = []
-        self.element_stats = {}
+        self._priority_of = PRIORITY_MAP.get  # Bound once, one attribute access per lookup
+        self.interaction_count = 0
+        self.element_stats = collections.defaultdict(lambda: {
+            'interactions': 0,
+            'avg_hover_time': 0,
+            'traced': 0
+        })
+        self.top_elements = []  # Min-heap of (interactions, element_type), at most TOP_N
 
     def get_priority(self, element_type):
         """Get priority level for element type"""
-        if element_type in CONFIG['priorities']['high']:
-            return 'high'
-        elif element_type in CONFIG['priorities']['medium']:
-            return 'medium'
-        elif element_type in CONFIG['priorities']['skip']:
-            return 'skip'
-        return 'low'
+        return self._priority_of(element_type, 'low')
 
     def record_interaction(self, element_type, duration=0, action='hover'):
         """Record an interaction"""
-        self.interactions.append({
-            'type': element_type,
-            'action': action,
-            'duration': duration,
-            'timestamp': time.time()
-        })
-
-        if element_type not in self.element_stats:
-            self.element_stats[element_type] = {
-                'interactions': 0,
-                'avg_hover_time': 0,
-                'traced': 0
-            }
+        self.interaction_count += 1
 
         stats = self.element_stats[element_type]
         stats['interactions'] += 1
@@ -83,121 +135,271 @@ class ElementPrioritizer:
         if action == 'trace':
             stats['traced'] += 1
 
+        self._update_top_elements(element_type, stats['interactions'])
+
+    def _update_top_elements(self, element_type, count):
+        """Keep the bounded top-N heap in step with a new interaction count"""
+        for idx, (_, top_type) in enumerate(self.top_elements):
+            if top_type == element_type:
+                self.top_elements[idx] = (count, element_type)
+                heapq.heapify(self.top_elements)
+                return
+
+        # Counts only grow, so an element enters once it beats the current minimum
+        if len(self.top_elements) < self.TOP_N:
+            heapq.heappush(self.top_elements, (count, element_type))
+        elif count > self.top_elements[0][0]:
+            heapq.heapreplace(self.top_elements, (count, element_type))
+
     def print_summary(self):
         """Print interaction summary"""
-        print(f"\n📊 Interaction Summary:")
-        print(f"  Total interactions: {len(self.interactions)}")
-
-        # Sort by interaction count
-        sorted_stats = sorted(
-            self.element_stats.items(),
-            key=lambda x: x[1]['interactions'],
-            reverse=True
-        )[:5]
-
-        print("  Top 5 most interacted elements:")
-        for idx, (element_type, stats) in enumerate(sorted_stats, 1):
-            print(
-                f"    {idx}. {element_type}: {stats['interactions']} interactions, "
-                f"avg hover {int(stats['avg_hover_time'])}ms, traced {stats['traced']}x"
+        log.info("\n📊 Interaction Summary:")
+        log.info("  Total interactions: %d", self.interaction_count)
+
+        log.info("  Top %d most interacted elements:", self.TOP_N)
+        for idx, (_, element_type) in enumerate(sorted(self.top_elements, reverse=True), 1):
+            stats = self.element_stats[element_type]
+            log.info(
+                "    %d. %s: %d interactions, avg hover %dms, traced %dx",
+                idx, element_type, stats['interactions'], stats['avg_hover_time'], stats['traced']
             )
 
 
-async def get_element_center(element):
-    """Get center position of element"""
-    box = await element.bounding_box()
-    if not box:
-        return None
+async def get_bbox(item, refresh=False):
+    """
+    Get bounding box of a sequence item, cached on the item
+    refresh re-reads it, falling back to the cached box if the read fails
+    """
+    if refresh or '_bbox' not in item:
+        try:
+            item['_bbox'] = await item['element'].bounding_box()
+        except Exception:
+            if '_bbox' not in item:
+                raise
+    return item['_bbox']
+
+
+async def find_elements(page):
+    """
+    Find elements for every configured selector
+    One combined query walks the DOM once; a single evaluate then tells
+    which selectors each match belongs to and reads its bounding box
+    (both come back in document order)
+    Returns (elements_by_type, boxes) - boxes maps element handle to box
+    """
+    try:
+        found, matches = await asyncio.gather(
+            page.query_selector_all(COMBINED_SELECTOR),
+            page.evaluate(COLLECT_ELEMENTS_JS, [COMBINED_SELECTOR, SELECTORS])
+        )
+    except Exception:
+        found, matches = None, None
+
+    if found is None or len(found) != len(matches):
+        # Invalid selector or DOM changed between the two calls - query one by one
+        results = await asyncio.gather(
+            *[page.query_selector_all(selector) for selector in SELECTORS],
+            return_exceptions=True
+        )
+        return {
+            element_type: result
+            for element_type, result in zip(ELEMENT_TYPES, results)
+            if result and not isinstance(result, Exception)
+        }, {}
+
+    elements_by_type = {}
+    boxes = {}
+    for element, match in zip(found, matches):
+        boxes[element] = match['box']
+        for idx in match['types']:
+            elements_by_type.setdefault(ELEMENT_TYPES[idx], []).append(element)
+
+    # Keep config order so the sequence is built the same way as before
     return {
-        'x': box['x'] + box['width'] / 2,
-        'y': box['y'] + box['height'] / 2
-    }
+        element_type: elements_by_type[element_type]
+        for element_type in ELEMENT_TYPES
+        if element_type in elements_by_type
+    }, boxes
+
+
+async def dispatch_mouse_path(cdp, path):
+    """
+    Replay a precomputed mouse path over a CDP session
+    Each step is (x, y, delay) - moves are fired on a fixed timeline
+    instead of waiting for each round-trip before sleeping
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    offset = 0
+    sends = []
+
+    for x, y, delay in path:
+        wait = start + offset - loop.time()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        sends.append(asyncio.create_task(cdp.send('Input.dispatchMouseEvent', {
+            'type': 'mouseMoved',
+            'x': x,
+            'y': y,
+            'button': 'none'
+        })))
+        offset += delay
+
+    await asyncio.gather(*sends)
+
+    # Hold the last position for the remaining path duration
+    remaining = start + offset - loop.time()
+    if remaining > 0:
+        await asyncio.sleep(remaining)
+
+
+def swift_move_path(humanizer, start, end):
+    """
+    Curved, eased (x, y, delay) path between two elements
+    Humanization's bezier curve with sine ease-in-out timing: slow start,
+    fast middle, slow landing
+    """
+    points = humanizer.generate_bezier_points(start, end, steps=random.randint(25, 40))
+    duration = random.uniform(*SWIFT_MOVE_RANGE)
+    last = len(points) - 1
+
+    # Inverse of the sine ease: when each evenly spaced point is reached
+    times = [math.acos(1 - 2 * idx / last) / math.pi * duration for idx in range(last + 1)]
+    delays = [later - earlier for earlier, later in zip(times, times[1:])] + [0]
 
+    # Same hand tremor as Humanization, but land exactly on the target
+    return [
+        (x + random.gauss(0, 1), y + random.gauss(0, 1), delay)
+        for (x, y), delay in zip(points[:-1], delays)
+    ] + [(*end, 0)]
 
-async def ultra_realistic_interaction(humanizer, element, element_type, prioritizer):
+
+async def ultra_realistic_interaction(humanizer, cdp, item, prioritizer, budget=None):
     """
     Perform ultra-realistic interaction with an element
     Pattern: move → hover → circle/trace → idle → done
+    Hover and idle shrink so the whole interaction fits in budget (seconds left)
+    Returns the final cursor position, or None if the element was skipped or failed
     """
-    import random
+    element = item['element']
+    element_type = item['type']
 
-    box = await element.bounding_box()
+    # Refreshed in the background during the previous interaction (see main),
+    # so this is at most one interaction old rather than the collection snapshot
+    box = await get_bbox(item)
     if not box:
-        return False
+        return None
 
     center = {
         'x': box['x'] + box['width'] / 2,
         'y': box['y'] + box['height'] / 2
     }
 
-    print(f"\n🎯 Focusing on {element_type}")
+    # Precompute every micro-movement up front so each phase is a single batch.
+    # Offsets are drawn in one random.choices call per phase rather than
+    # two randint calls per step
+    trace_path = []
+    if random.random() < 0.3:
+        corners = [
+            (box['x'], box['y']),
+            (box['x'] + box['width'], box['y']),
+            (box['x'] + box['width'], box['y'] + box['height']),
+            (box['x'], box['y'] + box['height']),
+        ]
+
+        # Interpolate along each edge so the outline is one smooth batch
+        edge_steps = 7
+        trace_path.append((*corners[0], random.uniform(0.1, 0.2)))
+        for (start_x, start_y), (end_x, end_y) in zip(corners, corners[1:]):
+            step_delay = random.uniform(0.1, 0.2) / edge_steps
+            for step in range(1, edge_steps + 1):
+                t = step / edge_steps
+                trace_path.append((
+                    start_x + (end_x - start_x) * t,
+                    start_y + (end_y - start_y) * t,
+                    step_delay
+                ))
+
+    hover_duration = random.uniform(*HOVER_RANGE)
+    idle_duration = random.uniform(*IDLE_RANGE)
+
+    # Whatever the approach and trace leave of the budget goes to hover + idle
+    if budget is not None:
+        trace_duration = sum(delay for _, _, delay in trace_path)
+        read_budget = max(budget - APPROACH_COST - trace_duration, MIN_READ_TIME)
+        scale = min(1, read_budget / (hover_duration + idle_duration))
+        hover_duration *= scale
+        idle_duration *= scale
+
+    # ~400ms per step, evened out so the steps add up to the full hover duration
+    hover_steps = math.ceil(hover_duration / 0.4)
+    hover_step_sleep = hover_duration / hover_steps
+    hover_offsets = iter(random.choices(range(-5, 6), k=hover_steps * 2))
+    hover_offsets = list(zip(hover_offsets, hover_offsets))
+
+    idle_x = center['x'] + random.randint(-25, 25)
+    idle_y = center['y'] + random.randint(10, 35)
+    idle_steps = math.ceil(idle_duration / 0.25)  # Upper bound at the shortest step
+    idle_offsets = iter(random.choices(range(-3, 4), k=idle_steps * 2))
+    idle_delays = [random.uniform(0.25, 0.4) for _ in range(idle_steps)]
+    idle_path = []
+    idle_elapsed = 0
+    for micro_x, micro_y, delay in zip(idle_offsets, idle_offsets, idle_delays):
+        if idle_elapsed >= idle_duration:
+            break
+        # Trim the last step so idle ends on time instead of up to a step late
+        delay = min(delay, idle_duration - idle_elapsed)
+        idle_path.append((idle_x + micro_x, idle_y + micro_y, delay))
+        idle_elapsed += delay
+
+    log.info("\n🎯 Focusing on %s", element_type)
 
     try:
         # 1. Humanized move to element
-        print(f"  → Humanization moving to ({int(center['x'])}, {int(center['y'])})")
-        await humanizer.move_to(element)
+        log.info("  → Humanization moving to (%d, %d)", center['x'], center['y'])
+        landing_x, landing_y = await humanizer.move_to(element)
 
         # 2. Hover with micro-movements
-        hover_duration = random.uniform(1.8, 2.8)
-        print(f"  → Hovering for {int(hover_duration * 1000)}ms")
+        log.info("  → Hovering for %dms", hover_duration * 1000)
 
-        # Stay on element with small movements
-        for _ in range(int(hover_duration * 2.5)):  # ~400ms per step
-            offset_x = random.randint(-5, 5)
-            offset_y = random.randint(-5, 5)
-            await humanizer.move_to(element, offset_x=offset_x, offset_y=offset_y)
-            await asyncio.sleep(0.4)
+        # Stay where move_to landed with small movements - it picks a random
+        # point inside the element, so jittering around the centre would jump
+        hover_path = [
+            (landing_x + offset_x, landing_y + offset_y, hover_step_sleep)
+            for offset_x, offset_y in hover_offsets
+        ]
+        await dispatch_mouse_path(cdp, hover_path)
 
         prioritizer.record_interaction(element_type, hover_duration * 1000, 'hover')
 
         # 3. Choose action: trace, hover, or nothing
-        action = random.random()
-
-        if action < 0.3:
+        if trace_path:
             # Trace outline
-            print(f"  → Tracing element outline")
-            corners = [
-                (box['x'], box['y']),
-                (box['x'] + box['width'], box['y']),
-                (box['x'] + box['width'], box['y'] + box['height']),
-                (box['x'], box['y'] + box['height']),
-            ]
-
-            for x, y in corners:
-                await humanizer.page.mouse.move(x, y)
-                await asyncio.sleep(random.uniform(0.1, 0.2))
+            log.info("  → Tracing element outline")
+            await dispatch_mouse_path(cdp, trace_path)
 
             prioritizer.record_interaction(element_type, 0, 'trace')
 
         # 4. Idle - micro movements (reading simulation)
-        idle_duration = random.uniform(2.2, 4.2)
-        print(f"  → Idling for {int(idle_duration * 1000)}ms")
-
-        idle_x = center['x'] + random.randint(-25, 25)
-        idle_y = center['y'] + random.randint(10, 35)
+        log.info("  → Idling for %dms", idle_duration * 1000)
 
+        # Go through Playwright here so its cursor position stays in sync
+        # for the interpolated moves that follow
         await humanizer.page.mouse.move(idle_x, idle_y)
 
         # Very small movements during idle
-        start_time = time.time()
-        while time.time() - start_time < idle_duration:
-            micro_x = idle_x + random.randint(-3, 3)
-            micro_y = idle_y + random.randint(-3, 3)
-            await humanizer.page.mouse.move(micro_x, micro_y)
-            await asyncio.sleep(random.uniform(0.25, 0.4))
+        await dispatch_mouse_path(cdp, idle_path)
 
-        return True
+        return idle_path[-1][:2] if idle_path else (idle_x, idle_y)
 
     except Exception as e:
-        print(f"  ⚠️  Interaction failed: {e}")
-        return False
+        log.warning("  ⚠️  Interaction failed: %s", e)
+        return None
 
 
 async def main():
     """Main recorder function"""
-    import random
-
-    print("🚀 Starting ultra-realistic Humanization-Playwright session recorder...\n")
+    log.info("🚀 Starting ultra-realistic Humanization-Playwright session recorder...\n")
 
     # Configure humanization (slow, highly humanized)
     config = HumanizationConfig(
@@ -212,7 +414,7 @@ async def main():
     # Create prioritizer
     prioritizer = ElementPrioritizer()
 
-    print("🌐 Launching browser with Patchright (undetected)...")
+    log.info("🌐 Launching browser with Patchright (undetected)...")
 
     # Launch browser context
     from patchright.async_api import async_playwright
@@ -234,34 +436,57 @@ async def main():
         context = await browser.new_context(
             viewport=CONFIG['viewport'],
             record_video_dir=str(recordings_dir),
-            record_video_size=CONFIG['viewport'],
+            record_video_size=CONFIG['video_size'],
         )
 
         page = await context.new_page()
 
+        # One CDP session shared by every interaction for raw mouse events
+        cdp = await context.new_cdp_session(page)
+
         # Initialize Humanization
         humanizer = Humanization(page, config)
 
-        print(f"🌐 Navigating to: {CONFIG['url']}")
-        await page.goto(CONFIG['url'], wait_until='networkidle')
-        await asyncio.sleep(3)
+        log.info("🌐 Navigating to: %s", CONFIG['url'])
+        await page.goto(CONFIG['url'], wait_until='domcontentloaded')
+
+        # Ready as soon as the charts render, not after network quiets down
+        try:
+            ready = await page.wait_for_selector(
+                CONFIG['selectors']['chartLabels'], state='attached', timeout=15000
+            )
+            await ready.dispose()
+        except Exception:
+            log.warning("⚠️  chartLabels not rendered within 15s, continuing anyway")
+
+        # Other focus types get one short grace period, waited on together
+        late_types = [t for t in CONFIG['priorities']['high'] if t != 'chartLabels']
+        waits = await asyncio.gather(
+            *[
+                page.wait_for_selector(CONFIG['selectors'][t], state='attached', timeout=3000)
+                for t in late_types
+            ],
+            return_exceptions=True
+        )
+        for element_type, result in zip(late_types, waits):
+            if isinstance(result, Exception):
+                log.warning("⚠️  %s not rendered within 3s, continuing without it", element_type)
+            elif result:
+                await result.dispose()
+
+        # Short settle so chart animations and late layout shifts finish before collecting
+        await asyncio.sleep(1)
 
-        print("✅ Page loaded")
-        print("📹 Video recording started\n")
+        log.info("✅ Page loaded")
+        log.info("📹 Video recording started\n")
 
         # Get all target elements
-        print("🖱️  Starting ultra-realistic simulation...\n")
+        log.info("🖱️  Starting ultra-realistic simulation...\n")
 
-        elements_by_type = {}
+        elements_by_type, boxes = await find_elements(page)
 
-        for element_type, selector in CONFIG['selectors'].items():
-            try:
-                found = await page.query_selector_all(selector)
-                if found:
-                    elements_by_type[element_type] = found
-                    print(f"🎯 Found {len(found)} elements for \"{element_type}\"")
-            except Exception as e:
-                pass
+        for element_type, found in elements_by_type.items():
+            log.info("🎯 Found %d elements for \"%s\"", len(found), element_type)
 
         # Categorize elements
         categorized = {'high': [], 'medium': [], 'low': []}
@@ -272,20 +497,23 @@ async def main():
                 continue
 
             for idx, element in enumerate(elements):
-                categorized[priority].append({
+                item = {
                     'element': element,
                     'type': element_type,
                     'index': idx,
                     'priority': priority
-                })
-
-        print(f"\n📊 Focus elements: {len(categorized['high'])} high-priority, "
-              f"{len(categorized['medium'])} medium-priority, "
-              f"{len(categorized['low'])} low-priority")
+                }
+                if element in boxes:
+                    item['_bbox'] = boxes[element]
+                categorized[priority].append(item)
+
+        log.info(
+            "\n📊 Focus elements: %d high-priority, %d medium-priority, %d low-priority",
+            len(categorized['high']), len(categorized['medium']), len(categorized['low'])
+        )
 
-        # Create sequence: mostly high-priority
-        sequence = []
-        sequence.extend(categorized['high'])
+        # Create sequence: mostly high-priority, shuffled, medium picks at the tail
+        sequence = random.sample(categorized['high'], len(categorized['high']))
 
         # Add some medium elements
         if categorized['medium']:
@@ -294,54 +522,78 @@ async def main():
                 min(2, len(categorized['medium']))
             ))
 
-        # Light shuffle
-        for i in range(len(sequence) - 1, 0, -1):
-            if random.random() < 0.25:
-                j = max(0, i - 2)
-                sequence[i], sequence[j] = sequence[j], sequence[i]
-
-        print(f"\n📝 Interaction sequence: {len(sequence)} elements")
+        log.info("\n📝 Interaction sequence: %d elements", len(sequence))
         for idx, item in enumerate(sequence, 1):
-            print(f"   {idx}. {item['type']} [{item['priority']}]")
+            log.info("   %d. %s [%s]", idx, item['type'], item['priority'])
 
         # Execute sequence
-        start_time = time.time()
+        start_time = time.monotonic()
 
         for i, item in enumerate(sequence):
-            elapsed = time.time() - start_time
-            if elapsed >= CONFIG['session_duration']:
+            # Stop rather than start an element that can't play out before the end
+            remaining = CONFIG['session_duration'] - (time.monotonic() - start_time)
+            if remaining < MIN_INTERACTION_COST:
                 break
 
+            # Re-read the next element's box in the background while this one plays out
+            prefetch = None
+            if i < len(sequence) - 1:
+                prefetch = asyncio.create_task(get_bbox(sequence[i + 1], refresh=True))
+
             # Perform interaction
-            await ultra_realistic_interaction(
+            position = await ultra_realistic_interaction(
                 humanizer,
-                item['element'],
-                item['type'],
-                prioritizer
+                cdp,
+                item,
+                prioritizer,
+                budget=remaining
             )
 
-            # Swift move to next element
-            if i < len(sequence) - 1 and elapsed < CONFIG['session_duration'] - 6:
-                print(f"  ⚡ Swift move to next element...")
-                await asyncio.sleep(random.uniform(0.4, 0.8))
-                next_element = sequence[i + 1]['element']
-                await humanizer.move_to(next_element)
-
-        print("\n✅ Ultra-realistic Humanization simulation completed")
+            if prefetch:
+                try:
+                    await prefetch
+                except Exception:
+                    pass  # No box cached yet either, fetched again on first use
+
+            # Swift move to next element, unless it won't get its turn.
+            # Without a known cursor position the next move_to does the approach
+            remaining = CONFIG['session_duration'] - (time.monotonic() - start_time)
+            if i < len(sequence) - 1 and remaining >= MIN_INTERACTION_COST + SWIFT_COST and position:
+                log.info("  ⚡ Swift move to next element...")
+                await asyncio.sleep(random.uniform(*SWIFT_PAUSE_RANGE))
+                try:
+                    next_box = await get_bbox(sequence[i + 1])
+                except Exception:
+                    next_box = None
+                if next_box:
+                    target = (
+                        next_box['x'] + next_box['width'] / 2,
+                        next_box['y'] + next_box['height'] / 2
+                    )
+                    await dispatch_mouse_path(cdp, swift_move_path(humanizer, position, target))
+                    # Sync Playwright's tracked cursor, move_to interpolates from it
+                    await page.mouse.move(*target)
+
+        log.info("\n✅ Ultra-realistic Humanization simulation completed")
         prioritizer.print_summary()
 
-        print("\n🏁 Session completed")
-        print("📹 Saving video...")
+        log.info("\n🏁 Session completed")
+        log.info("📹 Saving video...")
 
+        await cdp.detach()
         await page.close()
         await context.close()
         await browser.close()
 
         await asyncio.sleep(2)
 
-        print("\n✅ Video saved to ./recordings/")
-        print("👋 Done!")
+        log.info("\n✅ Video saved to ./recordings/")
+        log.info("👋 Done!")
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    listener = start_log_listener()
+    try:
+        asyncio.run(main())
+    finally:
+        listener.stop()